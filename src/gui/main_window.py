@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QMenuBar, QMenu, QStatusBar, QMessageBox, QLabel, QSplitter, QSystemTrayIcon, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QObject, QTimer
+from PyQt6.QtCore import Qt, pyqtSlot, QObject, QTimer, QMetaObject, Q_ARG
 from PyQt6.QtGui import QAction, QCloseEvent, QIcon
 
 from src.main import KreativDiktalo
@@ -63,11 +63,12 @@ class MainWindow(QMainWindow):
     Koordinálja az összes GUI komponenst és integrálja a KreativDiktalo backend-et.
     """
 
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", config: Optional[ConfigManager] = None):
         super().__init__()
 
         self.config_path = config_path
-        self.config: Optional[ConfigManager] = None
+        # Indításkor már betöltött config átvehető (ne olvassuk be kétszer)
+        self.config: Optional[ConfigManager] = config
         self.backend: Optional[KreativDiktalo] = None
         self.callback_bridge: Optional[CallbackBridge] = None
         self.splash: Optional[SplashScreen] = None
@@ -83,8 +84,9 @@ class MainWindow(QMainWindow):
         # Toast notification manager
         self.toast_manager = ToastManager()
 
-        # Listener restart guard flag
+        # Listener restart guard flags
         self._listener_restarting = False
+        self._restart_pending = False  # Unlock-ra ütemezett restart már vár
 
         # UI setup
         try:
@@ -293,9 +295,10 @@ class MainWindow(QMainWindow):
         self.splash = SplashScreen()
         self.splash.show()
 
-        # Load config
+        # Load config (ha még nincs átadva)
         try:
-            self.config = ConfigManager(self.config_path)
+            if self.config is None:
+                self.config = ConfigManager(self.config_path)
         except Exception as e:
             logger.error(f"Config betöltési hiba: {e}", exc_info=True)
             QMessageBox.critical(
@@ -342,7 +345,7 @@ class MainWindow(QMainWindow):
 
             # Transition to IDLE
             self.state_machine.transition_to(AppState.IDLE)
-            self.signals.emit_status("Készen áll!", 3000)
+            self._show_status("Készen áll!", 3000)
 
             logger.info("Alkalmazás sikeresen inicializálva")
 
@@ -440,6 +443,21 @@ class MainWindow(QMainWindow):
         self.backend.audio_recorder.on_audio_chunk = \
             self.callback_bridge.audio_chunk_callback
 
+    def _show_status(self, message: str, timeout: int = 3000):
+        """
+        Státusz üzenet közvetlenül a status bar-ra (queued, thread-safe)
+
+        A hotkey callback-ek nem a Qt thread-ben futnak, ezért queued
+        invokeMethod-ot használunk a signal hub kényelmi metódusa helyett.
+        """
+        QMetaObject.invokeMethod(
+            self.status_bar,
+            "showMessage",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, message),
+            Q_ARG(int, timeout)
+        )
+
     def _on_hotkey_press(self):
         """Hotkey lenyomva - rögzítés indítása"""
         logger.info("Hotkey pressed")
@@ -461,13 +479,13 @@ class MainWindow(QMainWindow):
 
         self.backend.audio_recorder.start_recording()
         self.state_machine.transition_to(AppState.RECORDING)
-        self.signals.emit_status("Rögzítés...", 0)
+        self._show_status("Rögzítés...", 0)
 
     def _on_hotkey_release(self):
         """Hotkey felengedve - rögzítés leállítása"""
         logger.info("Hotkey released")
         self.backend.audio_recorder.stop_recording()
-        self.signals.emit_status("Feldolgozás...", 0)
+        self._show_status("Feldolgozás...", 0)
 
         # Start processing
         self._process_recording_threaded()
@@ -544,14 +562,17 @@ class MainWindow(QMainWindow):
             "typing": "Beírás..."
         }
         message = stage_names.get(stage, stage)
-        self.signals.emit_status(message, 0)
+        self._show_status(message, 0)
+
+        # Hub felé is továbbítjuk (watchdog progress követés)
+        self.signals.stage_changed.emit(stage)
 
     @pyqtSlot()
     def _on_processing_complete(self):
         """Processing successfully completed"""
         logger.info("Processing complete")
         self.state_machine.transition_to(AppState.IDLE)
-        self.signals.emit_status("Kész!", 3000)
+        self._show_status("Kész!", 3000)
 
         # Proper worker cleanup
         if self.current_worker:
@@ -791,8 +812,11 @@ class MainWindow(QMainWindow):
                         ]
                     msg = _MSG.from_address(addr)
                     if msg.message == WM_WTSSESSION_CHANGE and msg.wParam == WTS_SESSION_UNLOCK:
-                        logger.info("Képernyő feloldva – hotkey listener újraindítása 2mp múlva")
-                        QTimer.singleShot(2000, self._restart_listener)
+                        # Lock/unlock viharnál csak egy restart legyen ütemezve
+                        if not self._restart_pending:
+                            self._restart_pending = True
+                            logger.info("Képernyő feloldva – hotkey listener újraindítása 2mp múlva")
+                            QTimer.singleShot(2000, self._restart_listener)
                 except Exception:
                     pass  # Natív üzenet feldolgozási hiba nem kritikus
 
@@ -808,14 +832,31 @@ class MainWindow(QMainWindow):
             lambda old, new: setattr(self, '_state_entered_at', _time.time())
         )
 
+        # Utolsó progress/stage jelzés időpontja - hosszú, de haladó feldolgozás
+        # (pl. 3 perces felvétel átírása) ne számítson elakadásnak
+        self._last_progress_at = _time.monotonic()
+        self.signals.stage_changed.connect(self._mark_progress)
+
         # 30 másodpercenként ellenőrzés
         self._health_timer = QTimer(self)
         self._health_timer.timeout.connect(self._check_health)
         self._health_timer.start(30000)
         logger.info("Watchdog timer elindult (30mp)")
 
+    def _mark_progress(self, *args):
+        """Progress/stage signal érkezett - a watchdog ablak újraindul"""
+        import time as _time
+        self._last_progress_at = _time.monotonic()
+
     def _check_health(self):
-        """Watchdog: ha > 120mp óta nem IDLE/INITIALIZING, auto-reset"""
+        """
+        Watchdog: elakadt állapot esetén auto-reset
+
+        - Nincs futó worker: > 120mp ugyanabban az állapotban és > 120mp óta nincs progress
+        - Fut a worker (pl. hosszú STT hívás): csak ha > 300mp óta nem jött stage jelzés,
+          így a hosszú de haladó feldolgozás nem szakad meg, a beragadt worker
+          (pl. timeout nélküli HTTP poll) viszont véges időn belül resetelődik
+        """
         import time as _time
         if self.backend is None:
             return  # Backend még nem kész
@@ -825,9 +866,18 @@ class MainWindow(QMainWindow):
             return  # Normális állapot
 
         time_in_state = _time.time() - getattr(self, '_state_entered_at', _time.time())
-        if time_in_state > 120:
+        since_progress = _time.monotonic() - getattr(self, '_last_progress_at', _time.monotonic())
+
+        worker_running = self.current_worker is not None and self.current_worker.isRunning()
+        if worker_running:
+            stalled = since_progress > 300
+        else:
+            stalled = time_in_state > 120 and since_progress > 120
+
+        if stalled:
             logger.warning(
-                f"Watchdog: '{current.value}' állapot {time_in_state:.0f} másodperce elakadt – auto-reset"
+                "Watchdog: '%s' állapot %.0f másodperce elakadt (utolsó progress: %.0f mp, worker fut: %s) – auto-reset",
+                current.value, time_in_state, since_progress, worker_running
             )
             self._restart_listener()
 
@@ -835,10 +885,12 @@ class MainWindow(QMainWindow):
         """Hotkey listener és state machine újraindítása (session unlock / watchdog / manuális)"""
         if self.backend is None:
             logger.warning("Backend még nincs inicializálva – újraindítás kihagyva")
+            self._restart_pending = False
             return
 
         if self._listener_restarting:
             logger.debug("Listener újraindítás már folyamatban van")
+            self._restart_pending = False
             return
 
         self._listener_restarting = True
@@ -862,18 +914,20 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Listener újraindítás hiba: {e}", exc_info=True)
             self._listener_restarting = False
+            self._restart_pending = False
 
     def _do_restart_listener(self):
         """Listener tényleges újraindítása (500ms késleltetéssel hívva)"""
         try:
             self.backend.hotkey_listener.start()
             logger.info("✅ Hotkey listener sikeresen újraindult")
-            self.signals.emit_status("Listener újraindítva", 3000)
+            self._show_status("Listener újraindítva", 3000)
         except Exception as e:
             logger.error(f"Listener start hiba: {e}", exc_info=True)
-            self.signals.emit_status("Listener újraindítás sikertelen!", 5000)
+            self._show_status("Listener újraindítás sikertelen!", 5000)
         finally:
             self._listener_restarting = False
+            self._restart_pending = False
 
     def _quit_application(self):
         """Properly quit the application (bypass minimize to tray)"""
@@ -3,6 +3,9 @@ Settings Dialog
 
 Comprehensive settings panel for customizing the app
 """
+import functools
+from types import MappingProxyType
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QPushButton, QLineEdit, QComboBox,
@@ -16,6 +19,85 @@ from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# STT provider <-> combo index (a combo elemek sorrendjével egyezik)
+_INDEX_TO_PROVIDER = ('groq', 'assemblyai', 'whisper')
+_PROVIDER_TO_INDEX = MappingProxyType({p: i for i, p in enumerate(_INDEX_TO_PROVIDER)})
+
+# Közös QSS sablon a sötét és világos témához - csak a színek különböznek
+_QSS_TEMPLATE = """
+    QTabWidget::pane {{
+        border: 1px solid {border};
+        background-color: {bg};
+    }}
+    QTabBar::tab {{
+        background-color: {tab_bg};
+        color: {fg};
+        padding: 8px 16px;
+        margin-right: 2px;
+        border: 1px solid {border};
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }}
+    QTabBar::tab:selected {{
+        background-color: #0078D4;
+        color: #FFFFFF;
+        font-weight: bold;
+    }}
+    QTabBar::tab:hover {{
+        background-color: {hover};
+    }}
+    QWidget {{
+        background-color: {bg};
+        color: {fg};
+    }}
+    QLabel {{
+        color: {fg};
+    }}
+    QLineEdit, QComboBox, QSpinBox {{
+        background-color: {input_bg};
+        color: {fg};
+        border: 1px solid {border};
+        padding: 4px;
+        border-radius: 3px;
+    }}
+    QCheckBox {{
+        color: {fg};
+    }}
+    QPushButton {{
+        background-color: #0078D4;
+        color: #FFFFFF;
+        border: none;
+        padding: 6px 16px;
+        border-radius: 3px;
+    }}
+    QPushButton:hover {{
+        background-color: #1084D8;
+    }}
+    QPushButton:pressed {{
+        background-color: #006CC1;
+    }}
+"""
+
+_PALETTES = {
+    'dark': {
+        'bg': '#2B2B2B',
+        'fg': '#FFFFFF',
+        'border': '#555555',
+        'tab_bg': '#3C3C3C',
+        'hover': '#505050',
+        'input_bg': '#3C3C3C',
+    },
+    'light': {
+        'bg': '#FFFFFF',
+        'fg': '#000000',
+        'border': '#CCCCCC',
+        'tab_bg': '#F0F0F0',
+        'hover': '#E0E0E0',
+        'input_bg': '#FFFFFF',
+    },
+}
+
 
 class HotkeyEdit(QLineEdit):
     """Custom widget for capturing hotkey combinations"""
@@ -221,8 +303,7 @@ class SettingsDialog(QDialog):
 
         # Speech
         provider = self.config.get('stt.provider', 'groq')
-        provider_map = {'groq': 0, 'assemblyai': 1, 'whisper': 2}
-        self.stt_provider_combo.setCurrentIndex(provider_map.get(provider, 0))
+        self.stt_provider_combo.setCurrentIndex(_PROVIDER_TO_INDEX.get(provider, 0))
 
         # Text
         self.enable_cleaning_check.setChecked(self.config.get('text_processing.enable_cleaning', True))
@@ -249,8 +330,7 @@ class SettingsDialog(QDialog):
         self.config.set('hotkeys.command_mode', self.command_hotkey.text())
 
         # Speech
-        provider_map = {0: 'groq', 1: 'assemblyai', 2: 'whisper'}
-        provider = provider_map[self.stt_provider_combo.currentIndex()]
+        provider = _INDEX_TO_PROVIDER[self.stt_provider_combo.currentIndex()]
         self.config.set('stt.provider', provider)
 
         # Text
@@ -273,115 +353,9 @@ class SettingsDialog(QDialog):
         theme = "dark" if theme_text == "Sötét" else "light"
         self.tabs.setStyleSheet(self._get_stylesheet(theme))
 
-    def _get_stylesheet(self, theme: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _get_stylesheet(theme: str) -> str:
         """Get stylesheet for given theme"""
-        if theme == "dark":
-            return """
-                QTabWidget::pane {
-                    border: 1px solid #555555;
-                    background-color: #2B2B2B;
-                }
-                QTabBar::tab {
-                    background-color: #3C3C3C;
-                    color: #FFFFFF;
-                    padding: 8px 16px;
-                    margin-right: 2px;
-                    border: 1px solid #555555;
-                    border-bottom: none;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #0078D4;
-                    color: #FFFFFF;
-                    font-weight: bold;
-                }
-                QTabBar::tab:hover {
-                    background-color: #505050;
-                }
-                QWidget {
-                    background-color: #2B2B2B;
-                    color: #FFFFFF;
-                }
-                QLabel {
-                    color: #FFFFFF;
-                }
-                QLineEdit, QComboBox, QSpinBox {
-                    background-color: #3C3C3C;
-                    color: #FFFFFF;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                    border-radius: 3px;
-                }
-                QCheckBox {
-                    color: #FFFFFF;
-                }
-                QPushButton {
-                    background-color: #0078D4;
-                    color: #FFFFFF;
-                    border: none;
-                    padding: 6px 16px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #1084D8;
-                }
-                QPushButton:pressed {
-                    background-color: #006CC1;
-                }
-            """
-        else:  # light theme
-            return """
-                QTabWidget::pane {
-                    border: 1px solid #CCCCCC;
-                    background-color: #FFFFFF;
-                }
-                QTabBar::tab {
-                    background-color: #F0F0F0;
-                    color: #000000;
-                    padding: 8px 16px;
-                    margin-right: 2px;
-                    border: 1px solid #CCCCCC;
-                    border-bottom: none;
-                    border-top-left-radius: 4px;
-                    border-top-right-radius: 4px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #0078D4;
-                    color: #FFFFFF;
-                    font-weight: bold;
-                }
-                QTabBar::tab:hover {
-                    background-color: #E0E0E0;
-                }
-                QWidget {
-                    background-color: #FFFFFF;
-                    color: #000000;
-                }
-                QLabel {
-                    color: #000000;
-                }
-                QLineEdit, QComboBox, QSpinBox {
-                    background-color: #FFFFFF;
-                    color: #000000;
-                    border: 1px solid #CCCCCC;
-                    padding: 4px;
-                    border-radius: 3px;
-                }
-                QCheckBox {
-                    color: #000000;
-                }
-                QPushButton {
-                    background-color: #0078D4;
-                    color: #FFFFFF;
-                    border: none;
-                    padding: 6px 16px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #1084D8;
-                }
-                QPushButton:pressed {
-                    background-color: #006CC1;
-                }
-            """
+        palette = _PALETTES['dark'] if theme == "dark" else _PALETTES['light']
+        return _QSS_TEMPLATE.format(**palette)
@@ -22,7 +22,7 @@ class ApplicationSignals(QObject):
     # === RECORDING SIGNALS ===
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal()
-    audio_chunk_received = pyqtSignal(np.ndarray)  # Real-time audio chunks
+    audio_chunk_received = pyqtSignal(np.ndarray)  # Real-time audio chunks (float32, (N,) vagy (N, 1))
 
     # === PROCESSING SIGNALS ===
     transcription_started = pyqtSignal()
@@ -54,6 +54,9 @@ class ApplicationSignals(QObject):
         """
         Kényelmi metódus error signal emitelésére
 
+        Lassú út (extra Python hívás) - külső hívóknak; belső, ismert
+        célpontnál közvetlenül a signal-t vagy a slot-ot használd.
+
         Args:
             title: Hiba címe
             message: Hiba üzenete
@@ -64,6 +67,9 @@ class ApplicationSignals(QObject):
         """
         Kényelmi metódus warning signal emitelésére
 
+        Lassú út (extra Python hívás) - külső hívóknak; belső, ismert
+        célpontnál közvetlenül a signal-t vagy a slot-ot használd.
+
         Args:
             message: Figyelmeztetés üzenete
         """
@@ -73,6 +79,9 @@ class ApplicationSignals(QObject):
         """
         Kényelmi metódus status üzenet emitelésére
 
+        Lassú út (extra Python hívás) - külső hívóknak; belső, ismert
+        célpontnál közvetlenül a signal-t vagy a slot-ot használd.
+
         Args:
             message: Státusz üzenet
             timeout: Megjelenítési idő milliszekundumban
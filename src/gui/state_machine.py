@@ -4,7 +4,7 @@ Application State Machine for Kreatív Diktáló
 Manages application state transitions and ensures valid state flow.
 """
 from enum import Enum
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 from src.utils.logger import get_logger
 from src.gui.signals import ApplicationSignals
 
@@ -26,28 +26,35 @@ class AppState(Enum):
     @property
     def display_name(self) -> str:
         """Magyar megjelenítési név"""
-        names = {
-            AppState.INITIALIZING: "Inicializálás",
-            AppState.IDLE: "Készen áll",
-            AppState.RECORDING: "Rögzítés",
-            AppState.PROCESSING: "Feldolgozás",
-            AppState.TYPING: "Beírás",
-            AppState.ERROR: "Hiba"
-        }
-        return names.get(self, self.value)
+        return _DISPLAY_NAMES[self]
 
     @property
     def color(self) -> str:
         """Állapothoz tartozó szín (hex)"""
-        colors = {
-            AppState.INITIALIZING: "#808080",  # Gray
-            AppState.IDLE: "#00FF00",          # Green
-            AppState.RECORDING: "#FF0000",     # Red
-            AppState.PROCESSING: "#0000FF",    # Blue
-            AppState.TYPING: "#FFA500",        # Orange
-            AppState.ERROR: "#FFFF00"          # Yellow
-        }
-        return colors.get(self, "#FFFFFF")
+        return _COLORS[self]
+
+
+# Állapot metaadatok - egyszer épülnek fel, nem minden property hívásnál
+_DISPLAY_NAMES: Dict[AppState, str] = {
+    AppState.INITIALIZING: "Inicializálás",
+    AppState.IDLE: "Készen áll",
+    AppState.RECORDING: "Rögzítés",
+    AppState.PROCESSING: "Feldolgozás",
+    AppState.TYPING: "Beírás",
+    AppState.ERROR: "Hiba"
+}
+
+_COLORS: Dict[AppState, str] = {
+    AppState.INITIALIZING: "#808080",  # Gray
+    AppState.IDLE: "#00FF00",          # Green
+    AppState.RECORDING: "#FF0000",     # Red
+    AppState.PROCESSING: "#0000FF",    # Blue
+    AppState.TYPING: "#FFA500",        # Orange
+    AppState.ERROR: "#FFFF00"          # Yellow
+}
+
+# Üres célhalmaz ismeretlen állapothoz (ne allokáljunk hívásonként)
+_EMPTY: FrozenSet[AppState] = frozenset()
 
 
 class InvalidTransitionError(Exception):
@@ -63,14 +70,16 @@ class StateMachine:
     átmenetek történjenek. Minden állapotváltozás signal-t emit-el.
     """
 
-    # Érvényes átmenetek (from_state -> [to_states])
+    __slots__ = ('signals', '_current_state', '_previous_state')
+
+    # Érvényes átmenetek (from_state -> {to_states})
     VALID_TRANSITIONS = {
-        AppState.INITIALIZING: [AppState.IDLE, AppState.ERROR],
-        AppState.IDLE: [AppState.RECORDING, AppState.ERROR],
-        AppState.RECORDING: [AppState.PROCESSING, AppState.IDLE, AppState.ERROR],
-        AppState.PROCESSING: [AppState.TYPING, AppState.IDLE, AppState.ERROR],
-        AppState.TYPING: [AppState.IDLE, AppState.ERROR],
-        AppState.ERROR: [AppState.IDLE, AppState.INITIALIZING]
+        AppState.INITIALIZING: frozenset({AppState.IDLE, AppState.ERROR}),
+        AppState.IDLE: frozenset({AppState.RECORDING, AppState.ERROR}),
+        AppState.RECORDING: frozenset({AppState.PROCESSING, AppState.IDLE, AppState.ERROR}),
+        AppState.PROCESSING: frozenset({AppState.TYPING, AppState.IDLE, AppState.ERROR}),
+        AppState.TYPING: frozenset({AppState.IDLE, AppState.ERROR}),
+        AppState.ERROR: frozenset({AppState.IDLE, AppState.INITIALIZING})
     }
 
     def __init__(self, signals: ApplicationSignals):
@@ -102,8 +111,7 @@ class StateMachine:
         Returns:
             True ha érvényes az átmenet, különben False
         """
-        valid_targets = self.VALID_TRANSITIONS.get(self._current_state, [])
-        return new_state in valid_targets
+        return new_state in self.VALID_TRANSITIONS.get(self._current_state, _EMPTY)
 
     def transition_to(self, new_state: AppState, force: bool = False):
         """
@@ -118,7 +126,7 @@ class StateMachine:
         """
         # Ugyanaz az állapot - nincs átmenet
         if new_state == self._current_state:
-            logger.debug(f"Már ebben az állapotban vagyunk: {new_state}")
+            logger.debug("Már ebben az állapotban vagyunk: %s", new_state)
             return
 
         # Validáció (ha nincs force)
@@ -135,9 +143,7 @@ class StateMachine:
         self._previous_state = old_state
         self._current_state = new_state
 
-        logger.info(
-            f"Állapotátmenet: {old_state.value} -> {new_state.value}"
-        )
+        logger.info("Állapotátmenet: %s -> %s", old_state.value, new_state.value)
 
         # Signal emitelés
         self.signals.state_changed.emit(old_state, new_state)
@@ -164,6 +170,9 @@ class StateMachine:
 
         Használd recovery után vagy újraindításkor
         """
+        if self._current_state is AppState.IDLE:
+            return
+
         logger.info("State machine reset to IDLE")
         self.transition_to(AppState.IDLE, force=True)
 
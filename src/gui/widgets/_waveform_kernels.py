@@ -0,0 +1,51 @@
+"""
+Waveform Kernels
+
+Min/max envelope számítás a waveform rajzoláshoz. Ha a numba elérhető,
+JIT-fordított egymenetes kernelt használunk, különben NumPy fallback-et.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _minmax_downsample_jit(x, out_min, out_max, chunk):
+        n = out_min.size
+        for i in range(n):
+            base = i * chunk
+            lo = x[base]
+            hi = x[base]
+            for j in range(1, chunk):
+                v = x[base + j]
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+            out_min[i] = lo
+            out_max[i] = hi
+
+
+def minmax_downsample(x: np.ndarray, out_min: np.ndarray, out_max: np.ndarray, chunk: int):
+    """
+    Min/max envelope nem átfedő, chunk méretű ablakokra
+
+    Args:
+        x: Bemenő sample-ok (1D, legalább out_min.size * chunk hosszú,
+            bármilyen numerikus dtype - a kimenetek dtype-ja egyezzen vele)
+        out_min: Kimenet - ablakonkénti minimum (előre allokált)
+        out_max: Kimenet - ablakonkénti maximum (előre allokált)
+        chunk: Ablakméret sample-okban
+    """
+    if HAS_NUMBA:
+        _minmax_downsample_jit(x, out_min, out_max, chunk)
+        return
+
+    windows = x[:out_min.size * chunk].reshape(out_min.size, chunk)
+    np.min(windows, axis=1, out=out_min)
+    np.max(windows, axis=1, out=out_max)
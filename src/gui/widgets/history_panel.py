@@ -7,25 +7,43 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
     QPushButton, QLabel, QTextEdit, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
-import pyperclip
+from collections import deque
 from datetime import datetime
-from typing import List, Dict
+from typing import Deque, List, Dict
+
+
+# pyperclip import-ja platformfüggő eszközöket keres (xclip/xsel/pbcopy),
+# ezért csak az első másoláskor töltjük be
+_pyperclip = None
+
+
+def _copy(text: str):
+    """Szöveg vágólapra másolása (lazy pyperclip import)"""
+    global _pyperclip
+    if _pyperclip is None:
+        import pyperclip as _pyperclip
+    _pyperclip.copy(text)
 
 
 class HistoryItem:
     """Single dictation history item"""
 
+    __slots__ = ('raw_text', 'cleaned_text', 'timestamp', '_display')
+
     def __init__(self, raw_text: str, cleaned_text: str, timestamp: datetime = None):
         self.raw_text = raw_text
         self.cleaned_text = cleaned_text
         self.timestamp = timestamp or datetime.now()
 
-    def __str__(self):
+        # Display string computed once (list rows never change)
         time_str = self.timestamp.strftime("%H:%M:%S")
-        preview = self.cleaned_text[:50] + "..." if len(self.cleaned_text) > 50 else self.cleaned_text
-        return f"[{time_str}] {preview}"
+        preview = cleaned_text[:50] + "..." if len(cleaned_text) > 50 else cleaned_text
+        self._display = f"[{time_str}] {preview}"
+
+    def __str__(self):
+        return self._display
 
 
 class HistoryPanel(QWidget):
@@ -45,7 +63,7 @@ class HistoryPanel(QWidget):
     def __init__(self, parent=None, max_items: int = 50):
         super().__init__(parent)
         self.max_items = max_items
-        self.history_items: List[HistoryItem] = []
+        self.history_items: Deque[HistoryItem] = deque(maxlen=max_items)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -156,22 +174,20 @@ class HistoryPanel(QWidget):
     def add_item(self, raw_text: str, cleaned_text: str):
         """Add new dictation to history"""
         item = HistoryItem(raw_text, cleaned_text)
-        self.history_items.insert(0, item)  # Add to beginning (newest first)
+        # Add to beginning (newest first) - deque maxlen drops the oldest
+        self.history_items.appendleft(item)
 
-        # Limit to max_items
-        if len(self.history_items) > self.max_items:
-            self.history_items = self.history_items[:self.max_items]
+        # Update list incrementally (only the new row, drop the evicted one)
+        list_item = QListWidgetItem(str(item))
+        list_item.setData(Qt.ItemDataRole.UserRole, item)
 
-        # Update list
-        self._refresh_list()
-
-    def _refresh_list(self):
-        """Refresh the history list widget"""
-        self.history_list.clear()
-        for item in self.history_items:
-            list_item = QListWidgetItem(str(item))
-            list_item.setData(Qt.ItemDataRole.UserRole, item)
-            self.history_list.addItem(list_item)
+        self.history_list.setUpdatesEnabled(False)
+        try:
+            self.history_list.insertItem(0, list_item)
+            if self.history_list.count() > self.max_items:
+                self.history_list.takeItem(self.max_items)
+        finally:
+            self.history_list.setUpdatesEnabled(True)
 
     def _on_selection_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
         """When user selects a history item"""
@@ -191,12 +207,11 @@ class HistoryPanel(QWidget):
             return
 
         item: HistoryItem = current.data(Qt.ItemDataRole.UserRole)
-        pyperclip.copy(item.cleaned_text)
+        _copy(item.cleaned_text)
 
         # Visual feedback
         original_text = self.copy_btn.text()
         self.copy_btn.setText("✅ Másolva!")
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(1500, lambda: self.copy_btn.setText(original_text))
 
     def _paste_selected(self):
@@ -217,4 +232,4 @@ class HistoryPanel(QWidget):
 
     def get_all_items(self) -> List[HistoryItem]:
         """Get all history items"""
-        return self.history_items.copy()
+        return list(self.history_items)
@@ -3,12 +3,35 @@ Status Indicator Widget
 
 Színes LED-szerű indikátor az alkalmazás állapotának megjelenítésére
 """
+from typing import Dict
+
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtGui import QPainter, QColor, QBrush
 
 from src.gui.state_machine import AppState
 
+# Label szöveg színek állapotonként
+# Ha sötét témában vagyunk, világos szín kell
+# Egyszerűsített verzió - mindig ugyanaz
+_TEXT_COLORS = {
+    AppState.INITIALIZING: "#808080",
+    AppState.IDLE: "#00DD00",
+    AppState.RECORDING: "#FF3333",
+    AppState.PROCESSING: "#3333FF",
+    AppState.TYPING: "#FF8800",
+    AppState.ERROR: "#FFDD00"
+}
+
+# Előre felépített label stylesheet-ek (ne formázzunk/parse-oljunk átmenetenként)
+_LABEL_STYLES = {
+    state: f"font-weight: bold; font-size: 14px; color: {color};"
+    for state, color in _TEXT_COLORS.items()
+}
+
+# Hex -> QColor cache (az állapot színek fix hex kódok, ne parse-oljuk újra)
+_QCOLOR_CACHE: Dict[str, QColor] = {}
+
 
 class StatusLED(QWidget):
     """
@@ -30,7 +53,15 @@ class StatusLED(QWidget):
         Args:
             color: Hex színkód (pl. "#FF0000")
         """
-        self.color = QColor(color)
+        qcolor = _QCOLOR_CACHE.get(color)
+        if qcolor is None:
+            qcolor = _QCOLOR_CACHE[color] = QColor(color)
+
+        # Ugyanaz a szín - nincs szükség újrarajzolásra
+        if qcolor == self.color:
+            return
+
+        self.color = qcolor
         self.update()  # Trigger repaint
 
     def paintEvent(self, event):
@@ -105,32 +136,7 @@ class StatusIndicator(QWidget):
         self.label.setText(state.display_name)
 
         # Label szín frissítése (olvashatóság)
-        text_color = self._get_text_color(state)
-        self.label.setStyleSheet(
-            f"font-weight: bold; font-size: 14px; color: {text_color};"
-        )
-
-    def _get_text_color(self, state: AppState) -> str:
-        """
-        Szöveg szín meghatározása állapot alapján
-
-        Args:
-            state: Alkalmazás állapot
-
-        Returns:
-            Hex színkód
-        """
-        # Ha sötét témában vagyunk, világos szín kell
-        # Egyszerűsített verzió - mindig ugyanaz
-        colors = {
-            AppState.INITIALIZING: "#808080",
-            AppState.IDLE: "#00DD00",
-            AppState.RECORDING: "#FF3333",
-            AppState.PROCESSING: "#3333FF",
-            AppState.TYPING: "#FF8800",
-            AppState.ERROR: "#FFDD00"
-        }
-        return colors.get(state, "#FFFFFF")
+        self.label.setStyleSheet(_LABEL_STYLES[state])
 
     @property
     def current_state(self) -> AppState:
@@ -8,6 +8,28 @@ from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtPrope
 from PyQt6.QtGui import QFont
 from typing import Literal
 
+# Toast háttérszínek típusonként
+_TOAST_COLORS = {
+    'info': 'rgba(40, 40, 40, 230)',
+    'success': 'rgba(40, 120, 40, 230)',
+    'warning': 'rgba(200, 120, 40, 230)',
+    'error': 'rgba(180, 40, 40, 230)'
+}
+
+# Előre felépített stylesheet-ek típusonként (egyszer formázva)
+_TOAST_STYLES = {
+    toast_type: f"""
+        QLabel {{
+            background-color: {bg_color};
+            color: white;
+            border-radius: 8px;
+            padding: 12px 20px;
+            font-size: 13px;
+        }}
+    """
+    for toast_type, bg_color in _TOAST_COLORS.items()
+}
+
 
 class ToastNotification(QLabel):
     """
@@ -32,15 +54,7 @@ class ToastNotification(QLabel):
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
 
         # Styling
-        self.setStyleSheet("""
-            QLabel {
-                background-color: rgba(40, 40, 40, 230);
-                color: white;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 13px;
-            }
-        """)
+        self.setStyleSheet(_TOAST_STYLES['info'])
 
         self.setFont(QFont("Segoe UI", 11))
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -50,6 +64,16 @@ class ToastNotification(QLabel):
         self.setGraphicsEffect(self.opacity_effect)
         self.opacity_effect.setOpacity(0)
 
+        # Reused fade animations (one per direction, connected once)
+        self._fade_in_anim = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self._fade_in_anim.setDuration(200)
+        self._fade_in_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+
+        self._fade_out_anim = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self._fade_out_anim.setDuration(200)
+        self._fade_out_anim.setEasingCurve(QEasingCurve.Type.InCubic)
+        self._fade_out_anim.finished.connect(self._on_fade_out_complete)
+
     def show_message(
         self,
         message: str,
@@ -73,23 +97,7 @@ class ToastNotification(QLabel):
         self.setText(message)
 
         # Set color based on type
-        colors = {
-            'info': 'rgba(40, 40, 40, 230)',
-            'success': 'rgba(40, 120, 40, 230)',
-            'warning': 'rgba(200, 120, 40, 230)',
-            'error': 'rgba(180, 40, 40, 230)'
-        }
-        bg_color = colors.get(toast_type, colors['info'])
-
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: white;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 13px;
-            }}
-        """)
+        self.setStyleSheet(_TOAST_STYLES.get(toast_type, _TOAST_STYLES['info']))
 
         # Position in bottom-right corner
         self.adjustSize()
@@ -111,22 +119,19 @@ class ToastNotification(QLabel):
 
     def fade_in(self):
         """Fade in animation"""
-        self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.animation.setDuration(200)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(1)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.animation.start()
+        self._fade_out_anim.stop()
+        self._fade_in_anim.stop()
+        self._fade_in_anim.setStartValue(0)
+        self._fade_in_anim.setEndValue(1)
+        self._fade_in_anim.start()
 
     def fade_out(self):
         """Fade out animation"""
-        self.animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.animation.setDuration(200)
-        self.animation.setStartValue(1)
-        self.animation.setEndValue(0)
-        self.animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        self.animation.finished.connect(self._on_fade_out_complete)
-        self.animation.start()
+        self._fade_in_anim.stop()
+        self._fade_out_anim.stop()
+        self._fade_out_anim.setStartValue(1)
+        self._fade_out_anim.setEndValue(0)
+        self._fade_out_anim.start()
 
     def _on_fade_out_complete(self):
         """Called when fade out animation completes"""
@@ -3,13 +3,31 @@ Transcription Display Widget
 
 Dual-panel megjelenítés a nyers és tisztított szövegnek
 """
+import logging
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QTextEdit, QLabel, QPushButton, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont
-import pyperclip
+
+from src.utils.logger import get_logger
+
+logger = get_logger()
+
+
+# pyperclip import-ja platformfüggő eszközöket keres (xclip/xsel/pbcopy),
+# ezért csak az első másoláskor töltjük be
+_pyperclip = None
+
+
+def _copy(text: str):
+    """Szöveg vágólapra másolása (lazy pyperclip import)"""
+    global _pyperclip
+    if _pyperclip is None:
+        import pyperclip as _pyperclip
+    _pyperclip.copy(text)
 
 
 class TranscriptionDisplay(QWidget):
@@ -132,16 +150,9 @@ class TranscriptionDisplay(QWidget):
         Args:
             text: Nyers STT szöveg
         """
-        from src.utils.logger import get_logger
-        logger = get_logger()
-        logger.info(f"=== TRANSCRIPTION DISPLAY === set_raw_text CALLED! Text: '{text}'")
-        logger.info(f"Widget visible: {self.isVisible()}, enabled: {self.isEnabled()}")
         self.raw_text_edit.setPlainText(text)
-        logger.info(f"Text set! Current content: '{self.raw_text_edit.toPlainText()}'")
-
-        # Force update
-        self.raw_text_edit.update()
-        self.update()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("set_raw_text len=%d", len(text))
 
     @pyqtSlot(str)
     def set_cleaned_text(self, text: str):
@@ -151,35 +162,26 @@ class TranscriptionDisplay(QWidget):
         Args:
             text: Tisztított LLM szöveg
         """
-        from src.utils.logger import get_logger
-        logger = get_logger()
-        logger.info(f"=== TRANSCRIPTION DISPLAY === set_cleaned_text CALLED! Text: '{text}'")
-        logger.info(f"Widget visible: {self.isVisible()}, enabled: {self.isEnabled()}")
         self.cleaned_text_edit.setPlainText(text)
-        logger.info(f"Text set! Current content: '{self.cleaned_text_edit.toPlainText()}'")
-
-        # Force update
-        self.cleaned_text_edit.update()
-        self.update()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("set_cleaned_text len=%d", len(text))
 
     def _copy_raw_text(self):
         """Nyers szöveg másolása vágólapra"""
         text = self.raw_text_edit.toPlainText()
         if text:
-            pyperclip.copy(text)
+            _copy(text)
             self.copy_raw_btn.setText("✅ Másolva!")
             # Reset after 2 seconds
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(2000, lambda: self.copy_raw_btn.setText("📋 Másolás"))
 
     def _copy_cleaned_text(self):
         """Tisztított szöveg másolása vágólapra"""
         text = self.cleaned_text_edit.toPlainText()
         if text:
-            pyperclip.copy(text)
+            _copy(text)
             self.copy_cleaned_btn.setText("✅ Másolva!")
             # Reset after 2 seconds
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(2000, lambda: self.copy_cleaned_btn.setText("📋 Másolás"))
 
     def clear_all(self):
@@ -4,12 +4,88 @@ Waveform Widget
 Valós idejű audio waveform megjelenítés rögzítés közben
 """
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, pyqtSlot, QTimer
-from PyQt6.QtGui import QPainter, QPen, QColor
+from PyQt6.QtCore import Qt, pyqtSlot, QPointF
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPolygonF, QPixmap, QPainterPath
 import numpy as np
-from collections import deque
+import threading
+import time
 from typing import Optional
 
+from src.gui.widgets._waveform_kernels import minmax_downsample
+
+# A megjelenítéshez (~200 px magasság) bőven elég az int16 felbontás
+_INT16_FULL_SCALE = 32767
+
+
+class _AudioRing:
+    """
+    Fix kapacitású int16 ring buffer (egy író, egy olvasó)
+
+    Az író sosem allokál: a chunk legfeljebb két slice másolással kerül be.
+    A lock csak az index frissítést védi, az adatmásolás azon kívül fut.
+
+    Tükrözött (2x méretű) buffer: minden írás mindkét félbe bekerül, így az
+    utolsó capacity sample mindig egy összefüggő slice - az olvasás zero-copy.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = np.zeros(2 * capacity, dtype=np.int16)
+        self._wpos = 0  # Következő írási index (0 <= wpos < capacity)
+        self._filled = 0  # Érvényes sample-ok száma (<= capacity)
+        self._lock = threading.Lock()
+
+    @property
+    def filled(self) -> int:
+        """Érvényes sample-ok száma"""
+        return self._filled
+
+    def write(self, chunk: np.ndarray):
+        """Chunk beírása (wrap esetén két slice másolás)"""
+        n = chunk.size
+        if n == 0:
+            return
+
+        capacity = self.capacity
+        if n >= capacity:
+            # Csak az utolsó capacity sample számít
+            np.copyto(self._buf[:capacity], chunk[-capacity:])
+            np.copyto(self._buf[capacity:], chunk[-capacity:])
+            with self._lock:
+                self._wpos = 0
+                self._filled = capacity
+            return
+
+        wpos = self._wpos
+        k1 = min(n, capacity - wpos)
+        np.copyto(self._buf[wpos:wpos + k1], chunk[:k1])
+        np.copyto(self._buf[capacity + wpos:capacity + wpos + k1], chunk[:k1])
+        if k1 < n:
+            np.copyto(self._buf[:n - k1], chunk[k1:])
+            np.copyto(self._buf[capacity:capacity + n - k1], chunk[k1:])
+
+        with self._lock:
+            self._wpos = (wpos + n) % capacity
+            self._filled = min(self._filled + n, capacity)
+
+    def read_latest(self) -> np.ndarray:
+        """Az érvényes sample-ok időrendben (legrégebbi elöl) - zero-copy view"""
+        with self._lock:
+            wpos = self._wpos
+            filled = self._filled
+
+        if filled < self.capacity:
+            # Még nem fordult körbe: a [0, wpos) tartomány az érvényes
+            return self._buf[:wpos]
+
+        return self._buf[wpos:wpos + self.capacity]
+
+    def clear(self):
+        """Ring ürítése"""
+        with self._lock:
+            self._wpos = 0
+            self._filled = 0
+
 
 class WaveformWidget(QWidget):
     """
@@ -25,44 +101,61 @@ class WaveformWidget(QWidget):
         # Buffer config
         self.sample_rate = 16000  # Whisper standard
         self.buffer_duration = 3.0  # másodperc
-        self.max_samples = int(self.sample_rate * self.buffer_duration)
 
-        # Circular buffer
-        self.audio_buffer = deque(maxlen=self.max_samples)
+        # Megjelenítéshez 4 kHz is bőven elég: beérkezéskor decimálunk,
+        # így a ring, a másolás és az envelope is 4x kisebb
+        self._ds_factor = 4
+        self._ds_carry = np.empty(0, dtype=np.float32)  # Maradék (< ds_factor) sample-ok
+        self.max_samples = int(self.sample_rate / self._ds_factor * self.buffer_duration)
+
+        # Circular buffer (előre allokált NumPy ring)
+        self._ring = _AudioRing(self.max_samples)
 
         # Vizualizáció config
         self.background_color = QColor("#1E1E1E")  # Sötét háttér
         self.waveform_color = QColor("#00FF00")  # Zöld waveform
         self.grid_color = QColor("#404040")  # Sötétszürke rács
+        self._placeholder_color = QColor("#808080")  # Placeholder szöveg
+        self._build_pens()
+
+        # Háttér + rács cache (csak resize / színváltás után rajzoljuk újra)
+        self._grid_cache: Optional[QPixmap] = None
+
+        # Envelope kimeneti buffer-ek (widget szélességhez méretezve)
+        self._env_min = np.empty(0, dtype=np.int16)
+        self._env_max = np.empty(0, dtype=np.int16)
 
         # Rendering
         self.downsample_factor = 10  # Csak minden N. sample-t rajzolunk
         self.is_recording = False
 
+        # Futó csúcsérték a normalizáláshoz (lassan lecsengő, AGC-szerű)
+        self._peak = 1e-6
+        self._peak_decay = 0.995
+
         # Méret
         self.setMinimumHeight(100)
         self.setMaximumHeight(200)
 
-        # Timer a smooth refresh-hez (30 FPS)
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.update)
-        self.refresh_timer.setInterval(33)  # ~30 FPS
+        # Eseményvezérelt újrarajzolás: új audio chunk-ra, legfeljebb ~30 FPS
+        self._last_paint_ns = 0
+        self._min_interval_ns = 33_000_000
 
         # Background fill
         self.setAutoFillBackground(True)
 
     @pyqtSlot()
     def on_recording_started(self):
-        """Rögzítés indult - tisztítjuk a buffert és indítjuk a timer-t"""
-        self.audio_buffer.clear()
+        """Rögzítés indult - tisztítjuk a buffert"""
+        self._reset_buffer()
         self.is_recording = True
-        self.refresh_timer.start()
+        self._last_paint_ns = 0
+        self.update()
 
     @pyqtSlot()
     def on_recording_stopped(self):
-        """Rögzítés leállt - megállítjuk a timer-t"""
+        """Rögzítés leállt"""
         self.is_recording = False
-        self.refresh_timer.stop()
         self.update()  # Utolsó frissítés
 
     @pyqtSlot(np.ndarray)
@@ -71,48 +164,86 @@ class WaveformWidget(QWidget):
         Új audio chunk érkezett
 
         Args:
-            chunk: Numpy array audio adatokkal (mono, float32, -1 to 1)
+            chunk: Numpy array audio adatokkal (mono, float32, -1 to 1),
+                (N,) alakú, contiguous - a (frames, 1) alak is elfogadott
         """
         if not self.is_recording:
             return
 
-        # Flatten ha multidim
-        if chunk.ndim > 1:
-            chunk = chunk.flatten()
-
-        # Hozzáadjuk a buffer-hez
-        self.audio_buffer.extend(chunk)
-
-        # A timer fogja triggerelni az update()-et
+        # (N,) contiguous float32 - a szokásos (frames, 1) float32 chunk-nál
+        # csak view, nincs másolás
+        chunk = np.ascontiguousarray(chunk.reshape(-1), dtype=np.float32)
+
+        # Decimálás (ds_factor sample átlaga), a maradék a következő chunk elé kerül
+        if self._ds_carry.size:
+            chunk = np.concatenate((self._ds_carry, chunk))
+        n_full = (chunk.size // self._ds_factor) * self._ds_factor
+        self._ds_carry = chunk[n_full:].copy()
+        chunk = chunk[:n_full].reshape(-1, self._ds_factor).mean(axis=1)
+
+        # Csúcsérték frissítése (chunk-onként egy redukció, nem frame-enként)
+        if chunk.size:
+            peak = float(np.abs(chunk).max())
+            self._peak = max(self._peak * self._peak_decay, peak)
+
+        # Hozzáadjuk a ring buffer-hez int16-ként (fele akkora memória sávszél)
+        np.clip(chunk, -1.0, 1.0, out=chunk)
+        chunk *= _INT16_FULL_SCALE
+        self._ring.write(chunk.astype(np.int16))
+
+        # Újrarajzolás kérése (Qt összevonja az update()-eket), max ~30 FPS
+        now = time.perf_counter_ns()
+        if now - self._last_paint_ns > self._min_interval_ns:
+            self._last_paint_ns = now
+            self.update()
+
+    def _reset_buffer(self):
+        """Ring buffer és csúcsérték ürítése"""
+        self._ring.clear()
+        self._ds_carry = np.empty(0, dtype=np.float32)
+        self._peak = 1e-6
 
     def paintEvent(self, event):
         """Qt paint event - waveform rajzolás"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Háttér
-        painter.fillRect(self.rect(), self.background_color)
-
-        # Rács rajzolása
-        self._draw_grid(painter)
+        # Háttér + rács (cache-ből)
+        if self._grid_cache is None or self._grid_cache.size() != self.size():
+            self._grid_cache = self._render_grid()
+        painter.drawPixmap(0, 0, self._grid_cache)
 
         # Waveform rajzolása
-        if len(self.audio_buffer) > 0:
+        if self._ring.filled > 0:
             self._draw_waveform(painter)
         else:
             # Placeholder szöveg ha nincs adat
-            painter.setPen(QColor("#808080"))
+            painter.setPen(self._placeholder_color)
             painter.drawText(
                 self.rect(),
                 Qt.AlignmentFlag.AlignCenter,
                 "Nincs audio adat" if not self.is_recording else "Rögzítés..."
             )
 
+    def resizeEvent(self, event):
+        """Méretváltozás - a háttér/rács cache érvénytelen"""
+        self._grid_cache = None
+        super().resizeEvent(event)
+
+    def _render_grid(self) -> QPixmap:
+        """Háttér és rács kirajzolása egy pixmap-be"""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(self.background_color)
+
+        painter = QPainter(pixmap)
+        self._draw_grid(painter)
+        painter.end()
+
+        return pixmap
+
     def _draw_grid(self, painter: QPainter):
         """Háttér rács rajzolása"""
-        pen = QPen(self.grid_color)
-        pen.setWidth(1)
-        painter.setPen(pen)
+        painter.setPen(self._grid_pen)
 
         width = self.width()
         height = self.height()
@@ -131,39 +262,62 @@ class WaveformWidget(QWidget):
         center_y = height // 2
 
         # Samples array-be
-        samples = np.array(self.audio_buffer)
+        samples = self._ring.read_latest()
 
         # Downsampling a gyorsabb renderingért
         if len(samples) > width * 2:
-            # Átlagoljuk a sample-okat
-            target_samples = width
-            chunk_size = len(samples) // target_samples
-            samples = samples[:chunk_size * target_samples].reshape(-1, chunk_size).mean(axis=1)
+            # Min/max envelope oszloponként (az átlagolás elveszti a csúcsokat)
+            if self._env_min.size != width:
+                self._env_min = np.empty(width, dtype=np.int16)
+                self._env_max = np.empty(width, dtype=np.int16)
+
+            chunk_size = len(samples) // width
+            minmax_downsample(samples, self._env_min, self._env_max, chunk_size)
+            self._draw_envelope(painter, self._env_min, self._env_max)
+            return
 
-        # Normalizálás -1 to 1 range-re
-        if samples.max() > 0:
-            samples = samples / max(abs(samples.max()), abs(samples.min()))
+        # Normalizálás -1 to 1 range-re (futó csúcsértékkel)
+        samples = samples * np.float32(1.0 / (max(self._peak, 1e-6) * _INT16_FULL_SCALE))
 
         # Rajzolás
-        pen = QPen(self.waveform_color)
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._wave_pen)
 
         num_samples = len(samples)
         if num_samples < 2:
             return
 
-        x_step = width / num_samples
+        # Pont koordináták vektorizáltan (amplitúdó -> pixel), egyetlen polyline hívás
+        xs = np.arange(num_samples, dtype=np.float32) * np.float32(width / num_samples)
+        ys = np.float32(center_y) - samples * np.float32(height * 0.4)
+
+        polygon = QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+        painter.drawPolyline(polygon)
+
+    def _draw_envelope(self, painter: QPainter, mins: np.ndarray, maxs: np.ndarray):
+        """Min/max envelope rajzolása kitöltött sávként (egy path, egy rajzoló hívás)"""
+        height = self.height()
+        center_y = height // 2
+
+        # Normalizálás -1 to 1 range-re (futó csúcsértékkel)
+        scale = np.float32(height * 0.4 / (max(self._peak, 1e-6) * _INT16_FULL_SCALE))
 
-        for i in range(num_samples - 1):
-            x1 = int(i * x_step)
-            x2 = int((i + 1) * x_step)
+        ys_top = center_y - maxs * scale
+        ys_bot = center_y - mins * scale
 
-            # Y koordináták (amplitúdó -> pixel)
-            y1 = int(center_y - samples[i] * (height * 0.4))
-            y2 = int(center_y - samples[i + 1] * (height * 0.4))
+        # Felső kontúr balról jobbra, alsó kontúr visszafelé -> zárt sáv
+        top = ys_top.tolist()
+        bot = ys_bot.tolist()
+        points = [QPointF(x, y) for x, y in enumerate(top)]
+        points.extend(QPointF(x, y) for x, y in zip(range(len(bot) - 1, -1, -1), reversed(bot)))
 
-            painter.drawLine(x1, y1, x2, y2)
+        path = QPainterPath()
+        path.addPolygon(QPolygonF(points))
+        path.closeSubpath()
+
+        # A pen a csendes (lapos) szakaszokat is láthatóvá teszi
+        painter.setPen(self._wave_pen)
+        painter.setBrush(self._wave_brush)
+        painter.drawPath(path)
 
     def set_colors(self, background: str, waveform: str, grid: str):
         """
@@ -177,9 +331,19 @@ class WaveformWidget(QWidget):
         self.background_color = QColor(background)
         self.waveform_color = QColor(waveform)
         self.grid_color = QColor(grid)
+        self._build_pens()
+        self._grid_cache = None
         self.update()
 
+    def _build_pens(self):
+        """Rács és waveform pen-ek felépítése (csak színváltáskor)"""
+        self._grid_pen = QPen(self.grid_color)
+        self._grid_pen.setWidth(1)
+        self._wave_pen = QPen(self.waveform_color)
+        self._wave_pen.setWidth(2)
+        self._wave_brush = QBrush(self.waveform_color)
+
     def clear(self):
         """Buffer törlése"""
-        self.audio_buffer.clear()
+        self._reset_buffer()
         self.update()
@@ -8,8 +8,10 @@ from PyQt6.QtCore import QThread, pyqtSignal
 from pathlib import Path
 from typing import Optional, Any
 import ctypes
+import importlib
 import sys
-import traceback
+import threading
+import time
 
 # NOTE: SpeechToText is intentionally NOT imported here at module level.
 # Importing it would trigger faster_whisper -> ctranslate2 -> torch -> c10.dll
@@ -22,6 +24,56 @@ from src.utils.config_manager import ConfigManager
 
 logger = get_logger()
 
+# SetForegroundWindow egyszer feloldva (nem minden diktálásnál), explicit
+# argtypes/restype-pal a ctypes marshaling gyors útjához
+_SetForegroundWindow = None
+if sys.platform == 'win32':
+    _SetForegroundWindow = ctypes.windll.user32.SetForegroundWindow
+    _SetForegroundWindow.argtypes = [ctypes.c_void_p]
+    _SetForegroundWindow.restype = ctypes.c_bool
+
+# STT provider -> modul (a _load_* metódusok ezeket importálják)
+_STT_MODULES = {
+    'groq': 'src.core.groq_stt',
+    'assemblyai': 'src.core.assemblyai_stt',
+    'whisper': 'src.core.speech_to_text',
+}
+
+_preload_lock = threading.Lock()
+_preloaded_providers = set()
+
+
+def preload_stt_module(provider: str):
+    """
+    STT provider modul előtöltése háttér daemon thread-ben
+
+    Az import (whisper esetén faster_whisper -> ctranslate2 -> torch) így
+    átfedésben fut a GUI felépítésével; a _load_* későbbi importja már csak
+    sys.modules lookup. Csak a konfigurált provider-t töltjük elő, mert a
+    whisper stack importja egyes Windows gépeken crash-el (lásd lent).
+
+    Args:
+        provider: STT provider neve ('groq', 'assemblyai', 'whisper')
+    """
+    module_name = _STT_MODULES.get(provider)
+    if module_name is None:
+        return
+
+    with _preload_lock:
+        if provider in _preloaded_providers:
+            return
+        _preloaded_providers.add(provider)
+
+    def _import():
+        try:
+            importlib.import_module(module_name)
+            logger.debug("STT modul előtöltve: %s", module_name)
+        except Exception as e:
+            # Nem kritikus - a _load_* újra megpróbálja és ott jelzi a hibát
+            logger.warning("STT modul előtöltés sikertelen (%s): %s", module_name, e)
+
+    threading.Thread(target=_import, name="STTPreload", daemon=True).start()
+
 
 class STTLoadWorker(QThread):
     """
@@ -128,7 +180,7 @@ class STTLoadWorker(QThread):
         device = self.config.get('stt.whisper.device', 'cpu')
         language = self.config.get('stt.whisper.language', 'hu')
 
-        logger.info(f"Whisper modell betöltése: {model_name} ({device})")
+        logger.info("Whisper modell betöltése: %s (%s)", model_name, device)
 
         self.stt = SpeechToText(
             model_name=model_name,
@@ -210,7 +262,7 @@ class ProcessingWorker(QThread):
                 )
                 return
 
-            logger.info(f"STT kész: '{raw_text[:100]}...'")
+            logger.info("STT kész: '%s...'", raw_text[:100])
             logger.info("Emitting transcription_complete signal")
             self.transcription_complete.emit(raw_text)
 
@@ -221,7 +273,7 @@ class ProcessingWorker(QThread):
                 logger.info("Processing: LLM tisztítás...")
                 self.stage_changed.emit("cleaning")
                 cleaned_text = self.llm.clean_text(raw_text)
-                logger.info(f"LLM kész: '{cleaned_text[:100]}...'")
+                logger.info("LLM kész: '%s...'", cleaned_text[:100])
             else:
                 logger.info("Processing: LLM tisztítás kihagyva (beállítás szerint)")
                 cleaned_text = raw_text
@@ -237,14 +289,13 @@ class ProcessingWorker(QThread):
             # During STT+LLM processing (which can take several seconds), the
             # dictation app itself may have stolen focus from the target textbox.
             # Without this, Ctrl+V would go to the wrong window.
-            if self.target_hwnd and sys.platform == 'win32':
+            if self.target_hwnd and _SetForegroundWindow:
                 try:
-                    import time as _time
-                    ctypes.windll.user32.SetForegroundWindow(self.target_hwnd)
-                    _time.sleep(0.15)  # Give Windows time to actually switch focus
-                    logger.debug(f"Focus restored to HWND: {self.target_hwnd}")
+                    _SetForegroundWindow(self.target_hwnd)
+                    time.sleep(0.15)  # Give Windows time to actually switch focus
+                    logger.debug("Focus restored to HWND: %s", self.target_hwnd)
                 except Exception as e:
-                    logger.warning(f"Focus restore sikertelen (HWND: {self.target_hwnd}): {e}")
+                    logger.warning("Focus restore sikertelen (HWND: %s): %s", self.target_hwnd, e)
 
             result = self.keyboard.type_text(cleaned_text, smart_paste=True)
 
@@ -258,7 +309,7 @@ class ProcessingWorker(QThread):
                     self.processing_complete.emit()
                 else:
                     # Complete failure
-                    logger.error(f"Billentyűzet beírás sikertelen: {result.get('message')}")
+                    logger.error("Billentyűzet beírás sikertelen: %s", result.get('message'))
                     self.error_occurred.emit(
                         "Beírási hiba",
                         result.get('message', 'A szöveg beírása sikertelen volt.')
@@ -269,8 +320,8 @@ class ProcessingWorker(QThread):
             self.processing_complete.emit()
 
         except Exception as e:
-            error_msg = f"Feldolgozási hiba:\n\n{str(e)}\n\n{traceback.format_exc()}"
-            logger.error(error_msg)
+            # A traceback-et a logging formázza (exc_info), csak hiba esetén
+            logger.error("Feldolgozási hiba:\n\n%s", e, exc_info=True)
             self.error_occurred.emit("Feldolgozási hiba", str(e))
 
 
@@ -6,7 +6,9 @@ Kreatív Diktáló indítása grafikus felülettel
 import sys
 import os
 import ctypes
+import threading
 from pathlib import Path
+from typing import Optional
 
 # Fix Windows symlink issues for HuggingFace cache
 os.environ['HF_HUB_DISABLE_SYMLINKS'] = '1'
@@ -24,11 +26,28 @@ if sys.platform == 'win32':
 # Projekt gyökér hozzáadása a path-hoz
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# IMPORTANT: Import torch before PyQt6 to avoid DLL loading issues on Windows
-import torch
+# IMPORTANT: torch must be loaded before PyQt6 to avoid DLL loading issues on Windows.
+# The import runs on a background thread so the DLL cold-load overlaps with the
+# Qt-independent startup work (logger setup, config load); main() waits for it
+# before the first PyQt6 import.
+_torch_ready = threading.Event()
+_torch_import_error: Optional[BaseException] = None
 
-from src.gui.app import KreativDiktaloGUI
-from src.gui.main_window import MainWindow
+
+def _preload_torch():
+    global _torch_import_error
+    try:
+        import torch  # noqa: F401
+    except Exception as e:
+        _torch_import_error = e  # main() naplózza, a whisper betöltés később jelzi a hibát
+    finally:
+        _torch_ready.set()
+
+
+threading.Thread(target=_preload_torch, name="TorchPreload", daemon=True).start()
+
+# NOTE: no PyQt6 (src.gui.*) imports at module level - see _torch_ready above
+from src.utils.config_manager import ConfigManager
 from src.utils.logger import setup_logger, get_logger
 
 
@@ -47,12 +66,33 @@ def main():
     logger.info("Kreatív Diktáló GUI Mode - Indítás")
     logger.info("=" * 60)
 
+    # Config egyszeri betöltése még a torch import alatt (Qt-független munka);
+    # a MainWindow ugyanezt a példányt kapja meg
+    config = None
+    try:
+        config = ConfigManager(str(config_path))
+    except Exception as e:
+        logger.warning("Config előtöltés sikertelen (a MainWindow újrapróbálja): %s", e)
+
+    # torch DLL-ek betöltve, mehet a PyQt6
+    _torch_ready.wait()
+    if _torch_import_error is not None:
+        logger.warning("torch import sikertelen: %s", _torch_import_error)
+
+    from src.gui.app import KreativDiktaloGUI
+    from src.gui.main_window import MainWindow
+    from src.gui.worker_threads import preload_stt_module
+
     try:
         # Create Qt Application
         app = KreativDiktaloGUI(sys.argv)
 
+        # STT provider modul előtöltése a háttérben (átfed a GUI felépítéssel)
+        if config is not None:
+            preload_stt_module(config.get('stt.provider', 'whisper'))
+
         # Create main window
-        main_window = MainWindow(str(config_path))
+        main_window = MainWindow(str(config_path), config=config)
 
         # IMPORTANT: Show and activate the window!
         main_window.show()
@@ -151,7 +151,7 @@ class KreativDiktalo:
                 self.logger.warning("⚠️  Nincs felismert szöveg")
                 return
 
-            self.logger.info(f"  ✅ Nyers szöveg: '{raw_text}'")
+            self.logger.info("  ✅ Nyers szöveg: '%s'", raw_text)
 
             # 3. LLM tisztítás (ha engedélyezve)
             enable_cleaning = self.config.get('text_processing.enable_cleaning', True)
@@ -159,7 +159,7 @@ class KreativDiktalo:
             if enable_cleaning:
                 self.logger.info("  [3/4] Szövegtisztítás (LLM)...")
                 cleaned_text = self.llm.clean_text(raw_text)
-                self.logger.info(f"  ✅ Tisztított szöveg: '{cleaned_text}'")
+                self.logger.info("  ✅ Tisztított szöveg: '%s'", cleaned_text)
             else:
                 self.logger.info("  [3/4] Szövegtisztítás kihagyva (beállítás szerint)")
                 cleaned_text = raw_text
@@ -174,7 +174,7 @@ class KreativDiktalo:
                 self.logger.error("❌ Szöveg beírás sikertelen")
 
         except Exception as e:
-            self.logger.error(f"❌ Hiba a feldolgozáskor: {e}", exc_info=True)
+            self.logger.error("❌ Hiba a feldolgozáskor: %s", e, exc_info=True)
 
     def start(self):
         """Alkalmazás indítása"""
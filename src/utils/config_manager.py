@@ -1,82 +1,220 @@
 """
 Konfiguráció kezelő modul
 """
+import collections.abc
+import copy
+import io
+import marshal
+import os
+import secrets
+import sys
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
 from src.utils.logger import get_logger
+from src.utils import validators
 
 logger = get_logger()
 
+# libyaml alapú C loader/dumper ha elérhető (~10x gyorsabb), különben pure-Python
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+    _HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+    _HAS_LIBYAML = False
+
+_MISSING = object()
+
+# Config olvasás buffer mérete (a teljes fájl egy syscall-lal beolvasható)
+_IO_BUFFER_SIZE = 65536
+
+# Temp fájl megnyitási flag-ek (O_BINARY: Windows-on ne legyen sorvége konverzió)
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Alapértelmezett konfiguráció (első indításkor íródik ki)
+_DEFAULT_CONFIG: Dict[str, Dict[str, Any]] = {
+    'hotkeys': {
+        'dictation': 'F8',
+        'command_mode': 'ctrl+shift+space'
+    },
+    'whisper': {
+        'model': 'large-v3',
+        'language': 'auto',
+        'device': 'cuda'
+    },
+    'ollama': {
+        'host': 'http://localhost:11434',
+        'model': 'llama3.1:8b',
+        'timeout': 30
+    },
+    'keyboard': {
+        'typing_speed': 0.01,
+        'paste_mode': True,
+        'delay_before_type': 0.1
+    },
+    'audio': {
+        'sample_rate': 16000,
+        'channels': 1,
+        'vad_enabled': True,
+        'silence_threshold': 0.01
+    },
+    'ui': {
+        'theme': 'dark',
+        'language': 'hu',
+        'show_preview': True,
+        'minimize_to_tray': True
+    },
+    'logging': {
+        'level': 'INFO',
+        'file_path': 'data/logs/app.log'
+    }
+}
+
+
+class _ReadOnlyView(collections.abc.Mapping):
+    """
+    Nested config dict élő, minden szinten read-only nézete
+
+    A beágyazott dict-eket is nézetbe csomagolja, így a szekciókon keresztül
+    sem lehet a config-ot (és a lapított cache-t) a set() megkerülésével módosítani.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        return _ReadOnlyView(value) if isinstance(value, dict) else value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
 
 class ConfigManager:
     """YAML konfiguráció kezelő"""
 
+    _libyaml_warned = False
+    # Már létrehozott/ellenőrzött mappák (processzenként egyszer mkdir)
+    _ensured_dirs: Set[Path] = set()
+
     def __init__(self, config_path: str = "config.yaml"):
         """
         Args:
             config_path: Konfig fájl elérési útja
         """
+        if not _HAS_LIBYAML and not ConfigManager._libyaml_warned:
+            logger.warning("libyaml nem elérhető - lassabb, pure-Python YAML parser használata")
+            ConfigManager._libyaml_warned = True
+
         self.config_path = Path(config_path)
+        # Parse-olt config marshal cache-e (csak pontosan egyező YAML mtime+méret esetén érvényes)
+        self._cache_path = self.config_path.with_name(self.config_path.name + '.cache')
         self.config: Dict[str, Any] = {}
+        # Lapított nézet: 'whisper.model' -> érték, így a get() egyetlen hash lookup
+        self._flat: Dict[str, Any] = {}
+        self._readonly_view: Mapping[str, Any] = _ReadOnlyView(self.config)
         self._load_config()
 
+    def _rebuild_flat(self):
+        """Lapított kulcs cache és read-only nézet újraépítése a nested config-ból"""
+        flat: Dict[str, Any] = {}
+        self._flatten(self.config, "", flat)
+        self._flat = flat
+        self._readonly_view = _ReadOnlyView(self.config)
+
+    @staticmethod
+    def _flatten(node: Dict[str, Any], prefix: str, out: Dict[str, Any]):
+        """Nested dict bejárása, minden szint (szekció és levél) bekerül pont szeparált kulccsal"""
+        for k, v in node.items():
+            if not isinstance(k, str) or v is None:
+                continue
+            flat_key = sys.intern(prefix + k)
+            out[flat_key] = v
+            if isinstance(v, dict):
+                ConfigManager._flatten(v, flat_key + ".", out)
+
     def _load_config(self):
         """Konfiguráció betöltése fájlból"""
         try:
-            if not self.config_path.exists():
+            # Egyetlen read() a teljes fájlra; a bytes-ot a libyaml közvetlenül dekódolja.
+            # Külön exists() helyett az open() hibáját kezeljük (egy syscall kettő helyett)
+            try:
+                with open(self.config_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    st = os.fstat(f.fileno())
+                    src_stamp = (st.st_mtime_ns, st.st_size)
+                    cached = self._load_cache(src_stamp)
+                    data = None if cached is not None else f.read()
+            except FileNotFoundError:
                 logger.warning(f"Config fájl nem található: {self.config_path}")
                 self._create_default_config()
                 return
 
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
+            if cached is not None:
+                self.config = cached
+            else:
+                self.config = yaml.load(data, Loader=_Loader) or {}
+                self._write_cache(src_stamp)
+
+            self._rebuild_flat()
 
             logger.info(f"Konfiguráció betöltve: {self.config_path}")
 
         except Exception as e:
             logger.error(f"Hiba a config betöltésekor: {e}")
             self.config = {}
+            self._flat = {}
+            self._readonly_view = _ReadOnlyView(self.config)
+
+    def _load_cache(self, src_stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Cache betöltése, ha a YAML fájl azóta nem változott
+
+        A cache-be mentett (mtime_ns, méret) párnak pontosan egyeznie kell a YAML
+        fájléval - így a visszaállított/mtime-megőrző másolással felülírt config
+        sem marad észrevétlen. marshal-t használunk (nem pickle-t): betöltéskor nem
+        futtat kódot, csak primitív típusokat épít.
+
+        Args:
+            src_stamp: A YAML fájl (st_mtime_ns, st_size) párja
+
+        Returns:
+            Cache-elt config dict, vagy None ha nincs/elavult/sérült
+        """
+        try:
+            with open(self._cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                stamp, cached = marshal.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Config cache nem használható: {e}")
+            return None
+
+        if stamp != src_stamp or not isinstance(cached, dict):
+            return None
+        return cached
+
+    def _write_cache(self, src_stamp: Tuple[int, int]):
+        """Parse-olt config kiírása cache-be (hiba esetén, pl. nem marshal-olható érték, kimarad)"""
+        try:
+            data = marshal.dumps((src_stamp, self.config))
+            with open(self._cache_path, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            logger.debug(f"Config cache írása sikertelen: {e}")
 
     def _create_default_config(self):
         """Alapértelmezett konfiguráció létrehozása"""
-        self.config = {
-            'hotkeys': {
-                'dictation': 'F8',
-                'command_mode': 'ctrl+shift+space'
-            },
-            'whisper': {
-                'model': 'large-v3',
-                'language': 'auto',
-                'device': 'cuda'
-            },
-            'ollama': {
-                'host': 'http://localhost:11434',
-                'model': 'llama3.1:8b',
-                'timeout': 30
-            },
-            'keyboard': {
-                'typing_speed': 0.01,
-                'paste_mode': True,
-                'delay_before_type': 0.1
-            },
-            'audio': {
-                'sample_rate': 16000,
-                'channels': 1,
-                'vad_enabled': True,
-                'silence_threshold': 0.01
-            },
-            'ui': {
-                'theme': 'dark',
-                'language': 'hu',
-                'show_preview': True,
-                'minimize_to_tray': True
-            },
-            'logging': {
-                'level': 'INFO',
-                'file_path': 'data/logs/app.log'
-            }
-        }
+        # 2 szintű klón: a levelek immutable primitívek, nem kell deepcopy
+        self.config = {section: dict(values) for section, values in _DEFAULT_CONFIG.items()}
+        self._rebuild_flat()
         self.save()
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -88,21 +226,27 @@ class ConfigManager:
             default: Alapértelmezett érték
 
         Returns:
-            Konfig érték vagy default
+            Konfig érték vagy default (szekció esetén read-only nézet -
+            módosítani csak set()-tel lehet, különben a lapított cache elavulna)
         """
-        keys = key.split('.')
-        value = self.config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._walk(key, _MISSING)
+            if value is _MISSING:
                 return default
+        return _ReadOnlyView(value) if isinstance(value, dict) else value
 
-            if value is None:
-                return default
+    def _walk(self, key: str, default: Any = None) -> Any:
+        """Lassú út: nested dict bejárása (ha a lapított cache nem tartalmazza a kulcsot)"""
+        value = self.config
+        try:
+            for k in key.split('.'):
+                value = value[k]
+        except (KeyError, TypeError):
+            # Hiányzó kulcs, vagy köztes szint nem dict (pl. None / skalár)
+            return default
 
-        return value
+        return default if value is None else value
 
     def set(self, key: str, value: Any):
         """
@@ -112,26 +256,79 @@ class ConfigManager:
             key: Kulcs (pont szeparált)
             value: Új érték
         """
-        keys = key.split('.')
-        config = self.config
+        flat = self._flat
 
-        # Navigálás a nested dict-ben
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        if '.' not in key:
+            config = self.config
+            leaf = key
+        else:
+            # Navigálás a nested dict-ben (a levél kulcs leválasztva, slice nélkül)
+            parent_path, leaf = key.rsplit('.', 1)
+            config = self.config
+            prefix = ""
+            for k in parent_path.split('.'):
+                prefix += k
+                nxt = config.get(k)
+                if nxt is None:
+                    nxt = {}
+                    config[k] = nxt
+                    flat[sys.intern(prefix)] = nxt
+                config = nxt
+                prefix += "."
 
         # Utolsó kulcs beállítása
-        config[keys[-1]] = value
+        old = config.get(leaf)
+        config[leaf] = value
+
+        # Lapított cache frissítése csak az érintett kulcsra (és részfára)
+        if isinstance(old, dict):
+            stale_prefix = key + "."
+            for flat_key in [k for k in flat if k.startswith(stale_prefix)]:
+                del flat[flat_key]
+        if value is None:
+            flat.pop(key, None)
+        else:
+            flat_key = sys.intern(key)
+            flat[flat_key] = value
+            if isinstance(value, dict):
+                self._flatten(value, flat_key + ".", flat)
+
         logger.debug(f"Config beállítva: {key} = {value}")
 
     def save(self):
         """Konfiguráció mentése fájlba"""
         try:
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            parent = self.config_path.parent
+            if parent not in ConfigManager._ensured_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                ConfigManager._ensured_dirs.add(parent)
+
+            buf = io.BytesIO()
+            yaml.dump(self.config, buf, Dumper=_Dumper, default_flow_style=False,
+                      allow_unicode=True, encoding='utf-8')
 
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, allow_unicode=True)
+            # Atomikus csere: temp fájl ugyanabban a mappában, majd os.replace
+            # (összeomláskor sem marad félig kiírt config)
+            # 0o666 kérés: új fájlnál a kernel a valódi umask-ot alkalmazza (mint open())
+            tmp_path = self.config_path.with_name(
+                f"{self.config_path.name}.{secrets.token_hex(4)}.tmp"
+            )
+            fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(buf.getvalue())
+                # Meglévő fájl jogosultságai maradjanak meg
+                try:
+                    os.chmod(tmp_path, os.stat(self.config_path).st_mode & 0o7777)
+                except FileNotFoundError:
+                    pass
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             logger.info(f"Konfiguráció mentve: {self.config_path}")
 
@@ -140,8 +337,17 @@ class ConfigManager:
 
     def reload(self):
         """Konfiguráció újratöltése"""
+        validators.cache_clear()
         self._load_config()
 
-    def get_all(self) -> Dict[str, Any]:
-        """Teljes konfiguráció dictionary lekérése"""
-        return self.config.copy()
+    def get_all(self) -> Mapping[str, Any]:
+        """
+        Teljes konfiguráció read-only nézete (másolás nélkül, minden szinten read-only)
+
+        Módosítani a set() metódussal lehet; ha módosítható másolat kell, snapshot().
+        """
+        return self._readonly_view
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Teljes konfiguráció független (deep) másolata"""
+        return copy.deepcopy(self.config)
@@ -1,85 +1,41 @@
 """
 Logging konfiguráció és setup
 """
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
-class Logger:
-    """Központi logging manager"""
-
-    _instance: Optional['Logger'] = None
-    _initialized: bool = False
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        if not self._initialized:
-            self.logger = logging.getLogger("KreativDiktalo")
-            self._initialized = True
-
-    def setup(
-        self,
-        level: str = "INFO",
-        log_file: Optional[str] = None,
-        max_bytes: int = 10485760,  # 10MB
-        backup_count: int = 5
-    ):
-        """
-        Logging beállítása
-
-        Args:
-            level: Log level (DEBUG, INFO, WARNING, ERROR)
-            log_file: Log fájl elérési útja
-            max_bytes: Maximális fájlméret rotate előtt
-            backup_count: Backup fájlok száma
-        """
-        # Log level beállítás
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        self.logger.setLevel(log_level)
-
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-
-        # File handler (ha meg van adva)
-        if log_file:
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(log_level)
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+# Központi logger - a logging modul saját registry-je már globális,
+# így elég egy modul szintű referencia (nincs szükség singleton osztályra)
+_LOGGER = logging.getLogger("KreativDiktalo")
+
+# Háttérszál, ami a queue-ból a fájlba írja a rekordokat
+_listener: Optional[QueueListener] = None
+_atexit_registered = False
 
-        self.logger.info("Logging inicializálva")
 
-    def get_logger(self) -> logging.Logger:
-        """Logger instance lekérése"""
-        return self.logger
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter, ami a másodperc pontosságú timestamp stringet újrahasznosítja"""
 
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        # (másodperc, string) egy tuple-ben, így szálak között atomikusan cserélődik
+        self._cached_time = (-1, "")
 
-# Global logger instance
-_logger_instance = Logger()
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_str = self._cached_time
+        if second == cached_second:
+            return cached_str
+
+        time_str = super().formatTime(record, datefmt)
+        self._cached_time = (second, time_str)
+        return time_str
 
 
 def get_logger() -> logging.Logger:
@@ -89,22 +45,103 @@ def get_logger() -> logging.Logger:
     Returns:
         logging.Logger: Logger instance
     """
-    return _logger_instance.get_logger()
+    return _LOGGER
 
 
 def setup_logger(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    max_bytes: int = 10485760,
+    max_bytes: int = 10485760,  # 10MB
     backup_count: int = 5
 ):
     """
     Global logger beállítása
 
     Args:
-        level: Log level
-        log_file: Log fájl path
-        max_bytes: Max file size
-        backup_count: Backup count
+        level: Log level (DEBUG, INFO, WARNING, ERROR)
+        log_file: Log fájl elérési útja
+        max_bytes: Maximális fájlméret rotate előtt
+        backup_count: Backup fájlok száma
     """
-    _logger_instance.setup(level, log_file, max_bytes, backup_count)
+    global _atexit_registered
+
+    # Ismételt hívásnál ne duplázódjanak a handlerek
+    shutdown_logger()
+    for handler in list(_LOGGER.handlers):
+        _LOGGER.removeHandler(handler)
+        handler.close()
+
+    # Log level beállítás
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    _LOGGER.setLevel(log_level)
+
+    # A formátum nem használ szál/processz/forrás infót - ne számolja ki a logging
+    # minden rekordnál (a _srcfile=None kikapcsolja a stack frame bejárást)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
+    # Formatter
+    formatter = _CachedTimeFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(formatter)
+    _LOGGER.addHandler(console_handler)
+
+    # File handler (ha meg van adva)
+    if log_file:
+        def _open_handler() -> RotatingFileHandler:
+            return RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding='utf-8'
+            )
+
+        # Mappát csak akkor hozunk létre, ha a megnyitás emiatt bukik el
+        try:
+            file_handler = _open_handler()
+        except FileNotFoundError:
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            file_handler = _open_handler()
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(formatter)
+
+        # A fájl írás (és rotate) háttérszálon fut, a hívó csak queue-ba tesz
+        _start_file_listener(file_handler)
+
+        if not _atexit_registered:
+            atexit.register(shutdown_logger)
+            _atexit_registered = True
+
+    _LOGGER.info("Logging inicializálva")
+
+
+def _start_file_listener(file_handler: logging.Handler):
+    """File handler bekötése QueueHandler + QueueListener párral"""
+    global _listener
+
+    log_queue = queue.SimpleQueue()
+    _LOGGER.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logger():
+    """Háttér log szál leállítása (a queue-ban maradt rekordok kiírásával)"""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
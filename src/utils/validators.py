@@ -1,13 +1,60 @@
 """
 Input validáció utility függvények
 """
+import functools
+import ipaddress
 import re
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Optional, Tuple
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
+# Engedélyezett modifierek és billentyűk
+_VALID_MODIFIERS = frozenset({'ctrl', 'alt', 'shift', 'win', 'cmd'})
+_VALID_KEYS = frozenset({
+    # F gombok
+    *(f'f{i}' for i in range(1, 13)),
+    # Számok
+    *(str(i) for i in range(10)),
+    # Betűk
+    *'abcdefghijklmnopqrstuvwxyz',
+    # Speciális
+    'space', 'enter', 'tab', 'backspace', 'delete', 'insert',
+    'home', 'end', 'pageup', 'pagedown',
+    'up', 'down', 'left', 'right',
+    'esc', 'escape'
+})
+
+# URL validáláshoz: engedélyezett sémák, domain név (urlsplit már kisbetűsíti a hostot)
+_URL_SCHEMES = frozenset({'http', 'https'})
+_HOSTNAME_RE = re.compile(r'(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,6}\.?')
+_HAS_WHITESPACE = re.compile(r'\s').search
+
+# Támogatott nyelvek (Whisper)
+_SUPPORTED_LANGS = frozenset({
+    'auto', 'en', 'zh', 'de', 'es', 'ru', 'ko', 'fr', 'ja', 'pt', 'tr',
+    'pl', 'ca', 'nl', 'ar', 'sv', 'it', 'id', 'hi', 'fi', 'vi', 'he',
+    'uk', 'el', 'ms', 'cs', 'ro', 'da', 'hu', 'ta', 'no', 'th', 'ur',
+    'hr', 'bg', 'lt', 'la', 'mi', 'ml', 'cy', 'sk', 'te', 'fa', 'lv',
+    'bn', 'sr', 'az', 'sl', 'kn', 'et', 'mk', 'br', 'eu', 'is', 'hy',
+    'ne', 'mn', 'bs', 'kk', 'sq', 'sw', 'gl', 'mr', 'pa', 'si', 'km',
+    'sn', 'yo', 'so', 'af', 'oc', 'ka', 'be', 'tg', 'sd', 'gu', 'am',
+    'yi', 'lo', 'uz', 'fo', 'ht', 'ps', 'tk', 'nn', 'mt', 'sa', 'lb',
+    'my', 'bo', 'tl', 'mg', 'as', 'tt', 'haw', 'ln', 'ha', 'ba', 'jw',
+    'su'
+})
+
+# Audio beállítások
+_SAMPLE_RATES = (8000, 16000, 22050, 44100, 48000)
+_VALID_SAMPLE_RATES = frozenset(_SAMPLE_RATES)
+_VALID_CHANNELS = frozenset((1, 2))
+
+# Érvénytelen fájlnév karakterek -> '_' (egyetlen str.translate menet)
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_WS_RE = re.compile(r'\s+')
+
 
 def validate_hotkey(hotkey: str) -> Tuple[bool, Optional[str]]:
     """
@@ -19,47 +66,42 @@ def validate_hotkey(hotkey: str) -> Tuple[bool, Optional[str]]:
     Returns:
         (valid, error_message) tuple
     """
+    # Típus ellenőrzés a cache előtt (pl. YAML lista nem hash-elhető)
     if not hotkey or not isinstance(hotkey, str):
         return False, "Hotkey nem lehet üres"
 
-    # Engedélyezett modifierek és billentyűk
-    valid_modifiers = {'ctrl', 'alt', 'shift', 'win', 'cmd'}
-    valid_keys = {
-        # F gombok
-        *[f'f{i}' for i in range(1, 13)],
-        # Számok
-        *[str(i) for i in range(10)],
-        # Betűk
-        *'abcdefghijklmnopqrstuvwxyz',
-        # Speciális
-        'space', 'enter', 'tab', 'backspace', 'delete', 'insert',
-        'home', 'end', 'pageup', 'pagedown',
-        'up', 'down', 'left', 'right',
-        'esc', 'escape'
-    }
-
-    # Szétválasztás
-    parts = [p.strip().lower() for p in hotkey.split('+')]
-
-    if len(parts) == 0:
-        return False, "Hotkey nem lehet üres"
+    return _validate_hotkey(hotkey)
 
-    # Utolsó rész a fő billentyű
-    main_key = parts[-1]
-    modifiers = parts[:-1]
 
-    # Modifierek ellenőrzése
-    for mod in modifiers:
-        if mod not in valid_modifiers:
-            return False, f"Érvénytelen modifier: {mod}"
+@functools.lru_cache(maxsize=256)
+def _validate_hotkey(hotkey: str) -> Tuple[bool, Optional[str]]:
+    """Hotkey validálás (nem üres str bemenetre, cache-elt)"""
+    # Szétválasztás (egyetlen lower() a teljes stringre), utolsó rész a fő billentyű
+    *modifiers, main_key = (p.strip() for p in hotkey.lower().split('+'))
+
+    # Modifierek ellenőrzése - a gyakori (érvényes) eset egy C szintű issuperset
+    if not _VALID_MODIFIERS.issuperset(modifiers):
+        bad = next(m for m in modifiers if m not in _VALID_MODIFIERS)
+        return False, f"Érvénytelen modifier: {bad}"
 
     # Fő billentyű ellenőrzése
-    if main_key not in valid_keys:
+    if main_key not in _VALID_KEYS:
         return False, f"Érvénytelen billentyű: {main_key}"
 
     return True, None
 
 
+@functools.lru_cache(maxsize=256)
+def _validate_path_syntax(path: str) -> Tuple[bool, Optional[str]]:
+    """Path szintaktikai ellenőrzése (fájlrendszer hozzáférés nélkül, ezért cache-elhető)"""
+    try:
+        Path(path)
+    except Exception as e:
+        return False, f"Érvénytelen path: {e}"
+
+    return True, None
+
+
 def validate_file_path(path: str, must_exist: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Fájl elérési út validálása
@@ -74,6 +116,11 @@ def validate_file_path(path: str, must_exist: bool = False) -> Tuple[bool, Optio
     if not path or not isinstance(path, str):
         return False, "Path nem lehet üres"
 
+    valid, error = _validate_path_syntax(path)
+    if not valid:
+        return valid, error
+
+    # A létezés ellenőrzése stat hívás, ezt nem cache-eljük
     try:
         p = Path(path)
 
@@ -103,19 +150,45 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
     if not url or not isinstance(url, str):
         return False, "URL nem lehet üres"
 
-    # Egyszerű URL regex
-    url_pattern = re.compile(
-        r'^https?://'  # http:// vagy https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-        r'(?::\d+)?'  # opcionális port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
-
-    if not url_pattern.match(url):
+    return _validate_url(url)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_url(url: str) -> Tuple[bool, Optional[str]]:
+    """URL validálás (nem üres str bemenetre, cache-elt)"""
+    if _HAS_WHITESPACE(url):
+        return False, "Érvénytelen URL formátum"
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False, "Érvénytelen URL formátum"
+
+    netloc = parts.netloc
+    if parts.scheme not in _URL_SCHEMES or not netloc or '@' in netloc:
+        return False, "Érvénytelen URL formátum"
+
+    # Opcionális port: csak számjegyek (tartomány ellenőrzés nélkül, mint korábban)
+    _, sep, port = netloc.partition(':')
+    if sep and not (port.isascii() and port.isdigit()):
+        return False, "Érvénytelen URL formátum"
+
+    # A host után vagy vége, vagy '/' / '?' + legalább egy karakter jön
+    # (közvetlenül a host utáni '#fragment' nem elfogadott)
+    rest = url[len(parts.scheme) + 3 + len(netloc):]
+    if rest and rest != '/' and (rest[0] not in '/?' or len(rest) == 1):
+        return False, "Érvénytelen URL formátum"
+
+    host = parts.hostname
+    if not host:
         return False, "Érvénytelen URL formátum"
 
+    if host != 'localhost' and not _HOSTNAME_RE.fullmatch(host):
+        try:
+            ipaddress.IPv4Address(host)
+        except ValueError:
+            return False, "Érvénytelen URL formátum"
+
     return True, None
 
 
@@ -132,21 +205,13 @@ def validate_language_code(code: str) -> Tuple[bool, Optional[str]]:
     if not code or not isinstance(code, str):
         return False, "Nyelvi kód nem lehet üres"
 
-    # Támogatott nyelvek (Whisper)
-    supported_languages = {
-        'auto', 'en', 'zh', 'de', 'es', 'ru', 'ko', 'fr', 'ja', 'pt', 'tr',
-        'pl', 'ca', 'nl', 'ar', 'sv', 'it', 'id', 'hi', 'fi', 'vi', 'he',
-        'uk', 'el', 'ms', 'cs', 'ro', 'da', 'hu', 'ta', 'no', 'th', 'ur',
-        'hr', 'bg', 'lt', 'la', 'mi', 'ml', 'cy', 'sk', 'te', 'fa', 'lv',
-        'bn', 'sr', 'az', 'sl', 'kn', 'et', 'mk', 'br', 'eu', 'is', 'hy',
-        'ne', 'mn', 'bs', 'kk', 'sq', 'sw', 'gl', 'mr', 'pa', 'si', 'km',
-        'sn', 'yo', 'so', 'af', 'oc', 'ka', 'be', 'tg', 'sd', 'gu', 'am',
-        'yi', 'lo', 'uz', 'fo', 'ht', 'ps', 'tk', 'nn', 'mt', 'sa', 'lb',
-        'my', 'bo', 'tl', 'mg', 'as', 'tt', 'haw', 'ln', 'ha', 'ba', 'jw',
-        'su'
-    }
-
-    if code.lower() not in supported_languages:
+    return _validate_language_code(code)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_language_code(code: str) -> Tuple[bool, Optional[str]]:
+    """Nyelvi kód validálás (nem üres str bemenetre, cache-elt)"""
+    if code.lower() not in _SUPPORTED_LANGS:
         return False, f"Nem támogatott nyelvi kód: {code}"
 
     return True, None
@@ -168,17 +233,27 @@ def validate_audio_settings(
     Returns:
         (valid, error_message) tuple
     """
+    # Típus ellenőrzés a cache előtt (nem szám, pl. YAML lista, nem hash-elhető)
+    for value in (sample_rate, channels, chunk_size):
+        if not isinstance(value, (int, float)):
+            return False, f"Érvénytelen audio beállítás (nem szám): {value!r}"
+
+    return _validate_audio_settings(sample_rate, channels, chunk_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_audio_settings(sample_rate: int, channels: int, chunk_size: int) -> Tuple[bool, Optional[str]]:
+    """Audio beállítás validálás (szám bemenetekre, cache-elt)"""
     # Sample rate
-    valid_sample_rates = [8000, 16000, 22050, 44100, 48000]
-    if sample_rate not in valid_sample_rates:
-        return False, f"Érvénytelen sample rate: {sample_rate} (engedélyezett: {valid_sample_rates})"
+    if sample_rate not in _VALID_SAMPLE_RATES:
+        return False, f"Érvénytelen sample rate: {sample_rate} (engedélyezett: {list(_SAMPLE_RATES)})"
 
     # Channels
-    if channels not in [1, 2]:
+    if channels not in _VALID_CHANNELS:
         return False, f"Érvénytelen csatorna szám: {channels} (1 vagy 2)"
 
     # Chunk size
-    if chunk_size < 128 or chunk_size > 8192:
+    if not 128 <= chunk_size <= 8192:
         return False, f"Érvénytelen chunk size: {chunk_size} (128-8192 között)"
 
     return True, None
@@ -195,12 +270,10 @@ def sanitize_filename(filename: str) -> str:
         Sanitized fájlnév
     """
     # Érvénytelen karakterek cseréje
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_SANITIZE_TABLE)
 
     # Whitespace normalizálás
-    filename = ' '.join(filename.split())
+    filename = _WS_RE.sub(' ', filename).strip()
 
     # Max hossz
     if len(filename) > 200:
@@ -208,3 +281,10 @@ def sanitize_filename(filename: str) -> str:
         filename = name[:200-len(ext)-1] + ('.' + ext if ext else '')
 
     return filename
+
+
+def cache_clear():
+    """Validátor cache-ek ürítése (pl. config újratöltéskor)"""
+    for func in (_validate_hotkey, _validate_path_syntax, _validate_url,
+                 _validate_language_code, _validate_audio_settings):
+        func.cache_clear()